@@ -6,6 +6,8 @@
 import os
 from dotenv import load_dotenv
 
+from src.utils.token_cache import get_token
+
 # 加载 .env 文件
 load_dotenv()
 
@@ -16,12 +18,22 @@ load_dotenv()
 API_BASE_URL = os.getenv('API_BASE_URL')
 API_ENDPOINT = os.getenv('API_ENDPOINT', '/api/v1/customers')
 API_TOKEN = os.getenv('API_TOKEN')
+API_LOGIN_URL = os.getenv('API_LOGIN_URL')  # 可选：未设置 API_TOKEN 时自动登录（带缓存）
+
+# 未提供 Token 时，通过登录接口获取（缓存到 ~/.cache/ingest_token.json，可用 TOKEN_CACHE_PATH 修改；写入失败时仅保存在内存）
+if not API_TOKEN and API_LOGIN_URL:
+    API_TOKEN = get_token(
+        API_LOGIN_URL,
+        os.getenv('API_USERNAME'),
+        os.getenv('API_PASSWORD'),
+        timeout=int(os.getenv('REQUEST_TIMEOUT', '30'))
+    )
 
 # 验证必需的配置
 if not API_BASE_URL:
     raise ValueError("❌ 缺少 API_BASE_URL 配置，请检查 .env 文件")
 if not API_TOKEN:
-    raise ValueError("❌ 缺少 API_TOKEN 配置，请检查 .env 文件")
+    raise ValueError("❌ 缺少 API_TOKEN（或 API_LOGIN_URL）配置，请检查 .env 文件")
 
 # ============================================================
 # S3 配置
@@ -29,14 +41,26 @@ if not API_TOKEN:
 
 S3_BUCKET = os.getenv('S3_BUCKET')
 S3_PREFIX = os.getenv('S3_PREFIX', 'raw/customers')
+STREAM_UPLOAD = os.getenv('STREAM_UPLOAD', 'true').lower() == 'true'  # 边提取边上传，不落地本地文件
 
 if not S3_BUCKET:
     raise ValueError("❌ 缺少 S3_BUCKET 配置，请检查 .env 文件")
 
+# ============================================================
+# 输出格式配置
+# ============================================================
+
+OUTPUT_FORMAT = os.getenv('OUTPUT_FORMAT', 'parquet').lower()  # parquet 或 csv
+COMPRESS_CSV = os.getenv('COMPRESS_CSV', 'true').lower() == 'true'  # CSV 输出 gzip 压缩 (.csv.gz)
+
+if OUTPUT_FORMAT not in ('parquet', 'csv'):
+    raise ValueError("❌ OUTPUT_FORMAT 只支持 parquet 或 csv，请检查 .env 文件")
+
 # ============================================================
 # 重试和速率限制配置
 # ============================================================
 
+# 首次请求失败后的重试次数（不含首次请求；默认 5，即每页最多请求 6 次）
 MAX_RETRIES = int(os.getenv('MAX_RETRIES', '5'))
 INITIAL_BACKOFF = float(os.getenv('INITIAL_BACKOFF', '1'))
 RECORDS_PER_PAGE = int(os.getenv('RECORDS_PER_PAGE', '1000'))
@@ -46,7 +70,13 @@ RECORDS_PER_PAGE = int(os.getenv('RECORDS_PER_PAGE', '1000'))
 # ============================================================
 
 REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))  # 请求超时（秒）
-INTER_PAGE_DELAY = float(os.getenv('INTER_PAGE_DELAY', '0.5'))  # 页面间延迟（秒）
+REQUESTS_PER_SECOND = float(os.getenv('REQUESTS_PER_SECOND', '10'))  # 每秒最大请求数（0 表示不限速）
+READ_AHEAD = int(os.getenv('READ_AHEAD', '8'))  # 并发预取页数
+
+if READ_AHEAD < 1:
+    raise ValueError("❌ READ_AHEAD 必须大于等于 1，请检查 .env 文件")
+if REQUESTS_PER_SECOND < 0:
+    raise ValueError("❌ REQUESTS_PER_SECOND 不能为负数，请检查 .env 文件")
 
 # 打印配置（用于调试，不显示敏感信息）
 def print_config():
@@ -56,6 +86,11 @@ def print_config():
     print(f"  API Token: {'*' * 20}...{API_TOKEN[-4:] if API_TOKEN else 'NOT SET'}")
     print(f"  S3 Bucket: {S3_BUCKET}")
     print(f"  S3 Prefix: {S3_PREFIX}")
+    print(f"  Stream Upload: {STREAM_UPLOAD}")
+    print(f"  Output Format: {OUTPUT_FORMAT}")
+    print(f"  Compress CSV: {COMPRESS_CSV}")
     print(f"  Max Retries: {MAX_RETRIES}")
     print(f"  Records per Page: {RECORDS_PER_PAGE}")
+    print(f"  Read Ahead: {READ_AHEAD}")
+    print(f"  Requests per Second: {REQUESTS_PER_SECOND or 'unlimited'}")
     print()
\ No newline at end of file
@@ -1,21 +1,24 @@
-﻿import requests
+﻿import time
+
+import requests
+
+from src.utils.token_cache import get_token_entry
 
 login_url = "https://xvserzimz6ofnmxbghdkqpgpma0horhq.lambda-url.us-east-2.on.aws/login"
 credentials = {"username": "admin", "password": "password123"}
 
-print("🔐 正在获取新 Token...\n")
-response = requests.post(login_url, json=credentials)
+print("🔐 正在获取 Token（优先使用缓存）...\n")
 
-if response.status_code == 200:
-    data = response.json()
-    token = data['access_token']
+try:
+    entry = get_token_entry(login_url, credentials["username"], credentials["password"])
+except requests.HTTPError as e:
+    print(f"❌ 失败: {e.response.status_code}")
+    print(e.response.text)
+else:
     print("✅ 成功！\n")
     print("="*70)
-    print("新 Token:")
+    print("Token:")
     print("="*70)
-    print(token)
+    print(entry['token'])
     print("="*70)
-    print(f"\n⏱️  有效期: {data['expires_in']} 秒")
-else:
-    print(f"❌ 失败: {response.status_code}")
-    print(response.text)
+    print(f"\n⏱️  有效期: {int(entry['expires_at'] - time.time())} 秒")
@@ -6,18 +6,18 @@ Production-ready robust implementation
 
 Architecture Decision Record (ADR)
 
-Decision 1: Output Format - CSV
+Decision 1: Output Format - Parquet (CSV optional)
 ------------------------------
 Rationale:
-1. Memory efficiency: Supports streaming writes, row by row, no need to load all records
-2. Recoverability: Can resume from last written position if program crashes
-3. Universality: Any tool (Excel, Pandas, SQL) can read directly
-4. Simplicity: No complex batch logic required (unlike Parquet)
+1. Memory efficiency: Records are written in bounded row groups, never all at once
+2. Typed, compact output: Fixed schema, dictionary encoding and Snappy compression
+3. Streaming: Output is uploaded to S3 (multipart) while pages are still extracted
+4. Flexibility: OUTPUT_FORMAT=csv writes gzip-compressed CSV for text-based tools
 
 Trade-offs:
 - JSON requires building complete structure in memory or using non-standard .ndjson
-- Parquet requires batching and more dependencies
-- CSV is most stable for "extract first, process later" strategy
+- Parquet needs pyarrow and is only readable once its footer is written on close
+- CSV is universal and line-readable, but larger and untyped
 
 Decision 2: Cleaning Strategy - ETL (Extract-Transform-Load)
 ------------------------------
@@ -43,9 +43,9 @@ Trade-offs:
 
 from config import (
     API_BASE_URL, API_ENDPOINT, API_TOKEN,
-    S3_BUCKET, S3_PREFIX,
+    S3_BUCKET, S3_PREFIX, STREAM_UPLOAD, OUTPUT_FORMAT, COMPRESS_CSV,
     MAX_RETRIES, INITIAL_BACKOFF, RECORDS_PER_PAGE,
-    REQUEST_TIMEOUT, INTER_PAGE_DELAY,
+    REQUEST_TIMEOUT, REQUESTS_PER_SECOND, READ_AHEAD,
     print_config
 )
 
@@ -68,7 +68,11 @@ def main():
         initial_backoff=INITIAL_BACKOFF,
         records_per_page=RECORDS_PER_PAGE,
         request_timeout=REQUEST_TIMEOUT,
-        inter_page_delay=INTER_PAGE_DELAY
+        requests_per_second=REQUESTS_PER_SECOND,
+        read_ahead=READ_AHEAD,
+        output_format=OUTPUT_FORMAT,
+        stream_upload=STREAM_UPLOAD,
+        compress_csv=COMPRESS_CSV
     )
 
 
@@ -2,14 +2,18 @@
 Customer data extraction orchestrator
 """
 
-import time
-import random
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from src.models.statistics import IngestionStats
 from src.processors.api_client import RobustAPIClient
 from src.processors.csv_writer import StreamingCSVWriter
-from src.storage.s3_uploader import upload_to_s3
+from src.processors.parquet_writer import StreamingParquetWriter
+from src.storage.s3_stream import S3MultipartWriter
+from src.storage.s3_uploader import upload_to_s3, build_s3_key
+from src.utils.logger import IngestionLogger
+from src.utils.rate_limiter import TokenBucket
 
 
 def extract_all_customers(
@@ -22,12 +26,16 @@ def extract_all_customers(
     initial_backoff=1,
     records_per_page=1000,
     request_timeout=30,
-    inter_page_delay=0.5
+    requests_per_second=10,
+    read_ahead=8,
+    output_format='parquet',
+    stream_upload=True,
+    compress_csv=True
 ):
     """
     Main extraction function (ETL Strategy)
 
-    Extract all customer data, clean it, and save to CSV
+    Extract all customer data, clean it, and save to Parquet (or CSV)
 
     Args:
         api_base_url: API base URL
@@ -35,35 +43,133 @@ def extract_all_customers(
         api_token: Authentication token
         s3_bucket: S3 bucket name
         s3_prefix: S3 key prefix
-        max_retries: Maximum retry attempts
+        max_retries: Retries after the first attempt
         initial_backoff: Initial backoff seconds
         records_per_page: Records per page
         request_timeout: Request timeout seconds
-        inter_page_delay: Delay between pages
+        requests_per_second: Maximum page requests per second across all
+            workers (0 disables rate limiting)
+        read_ahead: Maximum number of pages fetched concurrently
+        output_format: Output file format ('parquet' or 'csv')
+        stream_upload: If True, upload to S3 while extracting instead of
+            writing a local file first
+        compress_csv: If True, gzip CSV output (.csv.gz)
 
     Returns:
-        str: Local filename of extracted data
+        str: S3 URI when streaming, otherwise local filename of extracted data
     """
     print("\n Starting data extraction (ETL Strategy)...")
     print(f" API: {api_base_url}{api_endpoint}")
     print(f" S3 Target: s3://{s3_bucket}/{s3_prefix}/")
     print("-" * 50 + "\n")
 
-    # Initialize components
-    stats = IngestionStats()
+    # Initialize components. The client logs retries through the same
+    # logger as page progress, so buffered output stays in order.
+    stats = IngestionStats(output_format=output_format)
+    logger = IngestionLogger(prefix=" ", buffer_size=10)
     client = RobustAPIClient(
         base_url=api_base_url,
         token=api_token,
         stats=stats,
         max_retries=max_retries,
         initial_backoff=initial_backoff,
-        request_timeout=request_timeout
+        request_timeout=request_timeout,
+        pool_size=read_ahead,
+        logger=logger
     )
 
-    # Local temp file
-    local_filename = f"customers_extract_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    writer = StreamingCSVWriter(local_filename)
+    # Shared request budget for all fetch workers
+    limiter = None
+    if requests_per_second > 0:
+        limiter = TokenBucket(requests_per_second)
 
+    # Output: stream straight to S3, or a local temp file
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"customers_extract_{timestamp}.{output_format}"
+    compress = output_format == 'csv' and compress_csv
+    if compress:
+        filename += '.gz'
+
+    sink = None
+    if stream_upload:
+        sink = S3MultipartWriter(s3_bucket, build_s3_key(s3_prefix, filename))
+
+    if output_format == 'csv':
+        writer = StreamingCSVWriter(filename, fileobj=sink, compress=compress)
+    else:
+        writer = StreamingParquetWriter(filename, fileobj=sink)
+
+    try:
+        extracted = _extract_pages(
+            client,
+            writer,
+            stats,
+            api_endpoint,
+            records_per_page,
+            limiter,
+            read_ahead,
+            logger
+        )
+    except BaseException:
+        # Don't leave a partial object (or open multipart upload) behind,
+        # including on Ctrl-C, which ingest.py handles as a normal exit
+        if sink is not None:
+            sink.abort()
+
+        # Local runs keep the pages written so far; closing flushes them
+        # (and writes the Parquet footer) so the partial file is readable
+        writer.close()
+        raise
+
+    if not extracted:
+        print(" Failed to get first page, extraction aborted")
+        if sink is not None:
+            sink.abort()
+        writer.close()
+
+        # Nothing was extracted: don't leave a header-only file behind
+        if sink is None:
+            os.remove(filename)
+        return None
+
+    writer.close()
+
+    if sink is None:
+        print(f"\n Data extraction complete! Local file: {filename}")
+    else:
+        print(f"\n Data extraction complete! Streamed to: {sink.uri}")
+
+    # Print cleaning summary
+    writer.cleaner.print_summary()
+
+    # Upload to S3
+    if sink is None:
+        upload_to_s3(filename, s3_bucket, s3_prefix)
+
+    # Print final report
+    stats.print_report()
+
+    return filename if sink is None else sink.uri
+
+
+def _extract_pages(client, writer, stats, api_endpoint, records_per_page,
+                   limiter, read_ahead, logger):
+    """
+    Fetch every page and write its cleaned records in page order
+
+    Args:
+        client: RobustAPIClient instance
+        writer: Output writer (CSV or Parquet)
+        stats: IngestionStats instance for tracking
+        api_endpoint: API endpoint path
+        records_per_page: Records per page
+        limiter: TokenBucket limiting request rate (None for no limit)
+        read_ahead: Maximum number of pages fetched concurrently
+        logger: IngestionLogger for page progress and failures
+
+    Returns:
+        bool: False if the first page could not be fetched
+    """
     # First request: get total pages
     print(" Fetching metadata...")
     first_page_data = client.fetch_page_with_retry(
@@ -73,8 +179,7 @@ def extract_all_customers(
     )
 
     if not first_page_data:
-        print(" Failed to get first page, extraction aborted")
-        return None
+        return False
 
     # Parse metadata
     metadata = first_page_data.get('metadata', {})
@@ -84,48 +189,88 @@ def extract_all_customers(
     print(f" Records per page: {records_per_page}")
     print(f" Estimated total records: ~{total_pages * records_per_page:,}\n")
 
-    # Write first page (auto-cleaned)
-    records = first_page_data.get('data', [])
-    writer.write_records(records)
-    stats.pages_requested = 1
-    stats.add_success(writer.cleaner.records_accepted)
-    print(f" Page 1/{total_pages}: {len(records)} raw → "
-          f"{writer.cleaner.records_accepted} cleaned")
+    # Report progress roughly every 1% of pages, in buffered batches
+    progress_every = max(1, total_pages // 100)
 
-    # Fetch remaining pages
-    for page in range(2, total_pages + 1):
-        stats.pages_requested += 1
+    # Fetch remaining pages concurrently, drain in page order. Page 1 is
+    # drained first, so its records are cleaned while pages 2.. download.
+    executor = ThreadPoolExecutor(max_workers=read_ahead)
+    try:
+        pending = {}
+        next_page = 2
 
-        print(f" Page {page}/{total_pages}...", end=" ")
+        for page in range(1, total_pages + 1):
+            # Keep up to read_ahead pages in flight
+            while next_page <= total_pages and len(pending) < read_ahead:
+                pending[next_page] = executor.submit(
+                    _fetch_page,
+                    client,
+                    api_endpoint,
+                    next_page,
+                    records_per_page,
+                    limiter
+                )
+                next_page += 1
 
-        page_data = client.fetch_page_with_retry(
-            api_endpoint,
-            page=page,
-            limit=records_per_page
-        )
+            if page == 1:
+                page_data = first_page_data
+            else:
+                page_data = pending.pop(page).result()
+            stats.pages_requested += 1
 
-        if page_data:
-            records = page_data.get('data', [])
-            prev_accepted = writer.cleaner.records_accepted
-            writer.write_records(records)
-            new_accepted = writer.cleaner.records_accepted - prev_accepted
-            stats.add_success(new_accepted)
-            print(f"✅ {len(records)} raw → {new_accepted} cleaned")
-        else:
-            print(f"❌ Failed")
+            if page_data:
+                records = page_data.get('data', [])
+                prev_accepted = writer.cleaner.records_accepted
+                writer.write_records(records)
+                stats.add_success(writer.cleaner.records_accepted - prev_accepted)
 
-        # Rate limit protection with jitter
-        time.sleep(inter_page_delay + random.random() * 0.5)
+                if page == 1:
+                    print(f" Page 1/{total_pages}: {len(records)} raw → "
+                          f"{writer.cleaner.records_accepted} cleaned")
+                elif page % progress_every == 0 or page == total_pages:
+                    logger.progress(
+                        page,
+                        total_pages,
+                        f"✅ {stats.records_ingested:,} records cleaned"
+                    )
+            else:
+                logger.error(f"Page {page}/{total_pages} failed")
+    except BaseException:
+        # Don't wait for queued or retrying fetches before the error
+        # reaches the caller
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown()
+    finally:
+        logger.flush()
 
-    print(f"\n Data extraction complete! Local file: {local_filename}")
+    return True
 
-    # Print cleaning summary
-    writer.cleaner.print_summary()
 
-    # Upload to S3
-    upload_to_s3(local_filename, s3_bucket, s3_prefix)
+def _fetch_page(client, api_endpoint, page, records_per_page, limiter):
+    """
+    Fetch a single page from a worker thread
 
-    # Print final report
-    stats.print_report()
+    Workers share one token bucket, so they only wait when the combined
+    request rate reaches the configured budget.
+
+    Args:
+        client: RobustAPIClient instance
+        api_endpoint: API endpoint path
+        page: Page number (1-based)
+        records_per_page: Records per page
+        limiter: TokenBucket limiting request rate (None for no limit)
 
-    return local_filename
+    Returns:
+        dict: API response data, or None if all retries failed
+    """
+    # Rate limit protection (429s are still retried by the client)
+    if limiter is not None:
+        limiter.acquire()
+
+    return client.fetch_page_with_retry(
+        api_endpoint,
+        page=page,
+        limit=records_per_page
+    )
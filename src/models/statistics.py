@@ -2,7 +2,20 @@
 Statistics tracking for ingestion processes
 """
 
+import threading
 import time
+from collections import deque
+from itertools import islice
+
+
+# Number of recent errors kept for the report
+MAX_ERRORS = 100
+
+# Human-readable format descriptions for the execution report
+FORMAT_DESCRIPTIONS = {
+    'csv': 'CSV (Reason: Streaming efficiency)',
+    'parquet': 'Parquet (Reason: Columnar compression for analytics)'
+}
 
 
 class IngestionStats:
@@ -16,17 +29,20 @@ class IngestionStats:
         total_retries: Total retry attempts
         records_ingested: Total records successfully ingested
         start_time: Process start timestamp
-        errors: List of error messages
+        errors: Most recent (page, error) pairs, capped at MAX_ERRORS
+        output_format: Output file format ('csv' or 'parquet')
     """
 
-    def __init__(self):
+    def __init__(self, output_format='csv'):
         self.pages_requested = 0
         self.successful_pages = 0
         self.failed_pages = 0
         self.total_retries = 0
         self.records_ingested = 0
         self.start_time = time.time()
-        self.errors = []
+        self.errors = deque(maxlen=MAX_ERRORS)
+        self.output_format = output_format
+        self._lock = threading.Lock()
 
     def add_success(self, records_count):
         """
@@ -46,12 +62,14 @@ class IngestionStats:
             page: Page number that failed
             error: Error message
         """
-        self.failed_pages += 1
-        self.errors.append(f"Page {page}: {error}")
+        with self._lock:
+            self.failed_pages += 1
+            self.errors.append((page, error))
 
     def add_retry(self):
         """Record a retry attempt"""
-        self.total_retries += 1
+        with self._lock:
+            self.total_retries += 1
 
     def get_execution_time(self):
         """
@@ -85,13 +103,13 @@ class IngestionStats:
         print(f"Total Retries: {self.total_retries}")
         print(f"Records Ingested: {self.records_ingested:,}")
         print(f"Execution Time: {self.get_execution_time()}")
-        print(f"Format Chosen: CSV (Reason: Streaming efficiency)")
+        print(f"Format Chosen: {FORMAT_DESCRIPTIONS[self.output_format]}")
         print(f"Cleaning Strategy: ETL (Clean data before loading)")
 
         if self.errors:
-            print(f"\n  Errors encountered: {len(self.errors)}")
-            for error in self.errors[:5]:  # Show first 5 errors
-                print(f"   - {error}")
+            print(f"\n  Errors encountered: {self.failed_pages}")
+            for page, error in islice(self.errors, 5):  # Show first 5 kept errors
+                print(f"   - Page {page}: {error}")
 
         print("=" * 50 + "\n")
 
@@ -109,5 +127,6 @@ class IngestionStats:
             'total_retries': self.total_retries,
             'records_ingested': self.records_ingested,
             'execution_time': self.get_execution_time(),
-            'errors': self.errors
+            'output_format': self.output_format,
+            'errors': [f"Page {page}: {error}" for page, error in self.errors]
         }
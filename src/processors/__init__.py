@@ -3,7 +3,14 @@ Data processors for ingestion pipeline
 """
 
 from .api_client import RobustAPIClient
-from .data_cleaner import DataCleaner
+from .data_cleaner import DataCleaner, FIELDNAMES
 from .csv_writer import StreamingCSVWriter
+from .parquet_writer import StreamingParquetWriter
 
-__all__ = ['RobustAPIClient', 'DataCleaner', 'StreamingCSVWriter']
+__all__ = [
+    'RobustAPIClient',
+    'DataCleaner',
+    'FIELDNAMES',
+    'StreamingCSVWriter',
+    'StreamingParquetWriter'
+]
@@ -2,24 +2,91 @@
 Robust API client with retry and backoff mechanisms
 """
 
-import time
+import threading
+from concurrent.futures import Future
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 
+from src.utils.logger import IngestionLogger
 from src.utils.retry import calculate_backoff
 
 
+# Status codes retried by the transport (rate limit + transient server errors)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class StatsRetry(Retry):
+    """
+    urllib3 Retry policy that reports retries to IngestionStats
+
+    Waits honour the server's Retry-After header; otherwise they use
+    calculate_backoff (exponential with jitter, doubled for 429).
+    """
+
+    def __init__(self, *args, stats=None, initial_backoff=1, logger=None,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+        self.initial_backoff = initial_backoff
+        self.logger = logger or IngestionLogger(prefix=" ")
+
+    def new(self, **kwargs):
+        # urllib3 builds a fresh Retry per attempt; carry our fields along
+        kwargs.setdefault('stats', self.stats)
+        kwargs.setdefault('initial_backoff', self.initial_backoff)
+        kwargs.setdefault('logger', self.logger)
+        return super().new(**kwargs)
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        new_retry = super().increment(
+            method, url, response, error, _pool, _stacktrace
+        )
+
+        attempt = len(new_retry.history)
+        if response is not None:
+            reason = f"HTTP {response.status}"
+        else:
+            reason = type(error).__name__
+        self.logger.warning(
+            f"{reason} - retry {attempt}/{attempt + new_retry.total}"
+        )
+
+        if self.stats:
+            self.stats.add_retry()
+
+        return new_retry
+
+    def get_backoff_time(self):
+        if not self.history:
+            return 0
+
+        last = self.history[-1]
+        return calculate_backoff(
+            len(self.history) - 1,
+            self.initial_backoff,
+            is_rate_limit=last.status == 429
+        )
+
+
 class RobustAPIClient:
     """
     Robust API client with exponential backoff and retry
 
     Features:
-        - Exponential backoff with jitter
-        - Rate limit handling
+        - Transport-level retries (urllib3) with exponential backoff and jitter
+        - Rate limit handling (honours Retry-After)
+        - Concurrent requests for the same page share one HTTP request
         - Detailed error logging
     """
 
     def __init__(self, base_url, token, stats, max_retries=5,
-                 initial_backoff=1, request_timeout=30):
+                 initial_backoff=1, request_timeout=30, pool_size=32,
+                 logger=None):
         """
         Initialize API client
 
@@ -27,9 +94,13 @@ class RobustAPIClient:
             base_url: API base URL
             token: Authentication token
             stats: IngestionStats instance for tracking
-            max_retries: Maximum retry attempts
+            max_retries: Retries after the first attempt
             initial_backoff: Initial backoff time in seconds
             request_timeout: Request timeout in seconds
+            pool_size: Maximum pooled connections (at least the number of
+                concurrent requests, so connections are reused not discarded)
+            logger: IngestionLogger for retry and failure messages (share
+                the caller's logger to keep output in order)
         """
         self.base_url = base_url
         self.token = token
@@ -37,18 +108,81 @@ class RobustAPIClient:
         self.max_retries = max_retries
         self.initial_backoff = initial_backoff
         self.request_timeout = request_timeout
+        self.logger = logger or IngestionLogger(prefix=" ")
 
-        # Initialize session with auth headers
+        # Initialize session with auth headers. Advertise every encoding
+        # urllib3 can decode here (br/zstd only when their packages are
+        # installed) so compressed bodies are never handed back undecoded.
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING
         })
 
+        # Retries, backoff and connection pooling handled by the adapter
+        retry = StatsRetry(
+            total=max_retries,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            stats=stats,
+            initial_backoff=initial_backoff,
+            logger=self.logger
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=32,
+            pool_maxsize=pool_size
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # In-flight requests keyed by (endpoint, page, limit)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
     def fetch_page_with_retry(self, endpoint, page, limit):
         """
         Fetch a single page of data with retry mechanism
 
+        Args:
+            endpoint: API endpoint path
+            page: Page number (1-based)
+            limit: Records per page
+
+        Returns:
+            dict: API response data, or None if all retries failed
+        """
+        key = (endpoint, page, limit)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        # Another thread is already fetching this page: share its result
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = self._fetch_page(endpoint, page, limit)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _fetch_page(self, endpoint, page, limit):
+        """
+        Perform the HTTP request for a page (retries handled by the adapter)
+
         Args:
             endpoint: API endpoint path
             page: Page number (1-based)
@@ -60,65 +194,36 @@ class RobustAPIClient:
         url = f"{self.base_url}{endpoint}"
         params = {'page': page, 'limit': limit}
 
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(
-                    url,
-                    params=params,
-                    timeout=self.request_timeout
+        try:
+            response = self.session.get(
+                url,
+                params=params,
+                timeout=self.request_timeout
+            )
+
+            # Success: parse the raw bytes directly (no text decode step)
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+
+            # Retryable status still failing after all retries
+            if response.status_code in RETRY_STATUSES:
+                self.logger.error(
+                    f"Page {page} failed after {self.max_retries} retries"
                 )
-
-                # Success
-                if response.status_code == 200:
-                    return response.json()
-
-                # Rate limit (429)
-                elif response.status_code == 429:
-                    wait_time = calculate_backoff(
-                        attempt,
-                        self.initial_backoff,
-                        is_rate_limit=True
-                    )
-                    print(f"     Rate limit (429) - waiting {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                    self.stats.add_retry()
-                    continue
-
-                # Server errors (500, 503)
-                elif response.status_code in [500, 503]:
-                    wait_time = calculate_backoff(attempt, self.initial_backoff)
-                    print(f"     Server error ({response.status_code}) - "
-                          f"retry {attempt + 1}/{self.max_retries}, "
-                          f"waiting {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                    self.stats.add_retry()
-                    continue
-
-                # Other errors
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response.text[:100]}"
-                    print(f"   Unknown error: {error_msg}")
-                    self.stats.add_failure(page, error_msg)
-                    return None
-
-            except requests.exceptions.Timeout:
-                wait_time = calculate_backoff(attempt, self.initial_backoff)
-                print(f"    Request timeout - retry {attempt + 1}/{self.max_retries}, "
-                      f"waiting {wait_time:.1f}s...")
-                time.sleep(wait_time)
-                self.stats.add_retry()
-                continue
-
-            except Exception as e:
-                error_msg = f"Request exception: {str(e)}"
-                print(f"   {error_msg}")
-                self.stats.add_failure(page, error_msg)
+                self.stats.add_failure(page, "Max retries exceeded")
                 return None
 
-        # All retries exhausted
-        print(f"   Page {page} failed after {self.max_retries} retries")
-        self.stats.add_failure(page, "Max retries exceeded")
-        return None
+            # Other errors
+            error_msg = f"HTTP {response.status_code}: {response.text[:100]}"
+            self.logger.error(f"Unknown error: {error_msg}")
+            self.stats.add_failure(page, error_msg)
+            return None
+
+        except Exception as e:
+            error_msg = f"Request exception: {str(e)}"
+            self.logger.error(error_msg)
+            self.stats.add_failure(page, error_msg)
+            return None
 
     def close(self):
         """Close the session"""
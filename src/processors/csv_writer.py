@@ -3,6 +3,10 @@ Streaming CSV writer with integrated data cleaning
 """
 
 import csv
+import gzip
+import io
+
+from src.processors.data_cleaner import FIELDNAMES
 
 
 class StreamingCSVWriter:
@@ -10,22 +14,50 @@ class StreamingCSVWriter:
     Streaming CSV writer with ETL integration
 
     Features:
-        - Row-by-row writing (memory efficient)
+        - Batch writing through a single buffered file handle
+        - Optional gzip compression while streaming
         - Automatic data cleaning before write
         - Tracks cleaning statistics
     """
 
-    def __init__(self, filename, cleaner=None):
+    def __init__(self, filename, cleaner=None, fileobj=None, compress=False):
         """
         Initialize CSV writer
 
         Args:
             filename: Output filename
             cleaner: DataCleaner instance (optional, creates one if not provided)
+            fileobj: Binary stream to write to instead of a local file
+                (optional); completed on close() if it has a complete() method
+            compress: If True, gzip the output (filename should end in .gz)
         """
         self.filename = filename
-        self.header_written = False
-        self.fieldnames = None
+        self.fieldnames = FIELDNAMES
+
+        # Binary destination: local file or provided stream. The file is
+        # unbuffered because the BufferedWriter below does the buffering.
+        if fileobj is None:
+            fileobj = open(filename, 'wb', buffering=0)
+        self._raw = fileobj
+
+        # GzipFile.write is unbuffered, so always put a BufferedWriter in front
+        stream = self._raw
+        if compress:
+            stream = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=3)
+
+        # Keep one buffered handle open for the whole run
+        self._fh = io.TextIOWrapper(
+            io.BufferedWriter(stream, buffer_size=1 << 20),
+            encoding='utf-8',
+            newline=''
+        )
+        self._writer = csv.DictWriter(
+            self._fh,
+            fieldnames=self.fieldnames,
+            extrasaction='ignore',
+            restval='N/A'
+        )
+        self._writer.writeheader()
 
         # Use provided cleaner or create new one
         if cleaner is None:
@@ -44,42 +76,34 @@ class StreamingCSVWriter:
         if not records:
             return
 
-        # ETL: Clean data first
-        cleaned_records = []
-        for record in records:
-            cleaned = self.cleaner.clean_record(record)
-            if cleaned:  # Only keep valid records
-                cleaned_records.append(cleaned)
+        # ETL: Clean data first (invalid records are dropped)
+        cleaned_records = self.cleaner.clean_batch(records)
 
         if not cleaned_records:
             return
 
-        # Determine fieldnames from first batch
-        if not self.fieldnames:
-            all_keys = set()
-            for record in cleaned_records:
-                all_keys.update(record.keys())
-            self.fieldnames = sorted(list(all_keys))
-
-        # Append mode after header is written
-        mode = 'a' if self.header_written else 'w'
-
-        with open(self.filename, mode, newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=self.fieldnames,
-                extrasaction='ignore'
-            )
-
-            # Write header once
-            if not self.header_written:
-                writer.writeheader()
-                self.header_written = True
-
-            # Write cleaned data
-            for record in cleaned_records:
-                row = {key: record.get(key, 'N/A') for key in self.fieldnames}
-                writer.writerow(row)
+        # Write cleaned data (missing keys fall back to restval)
+        self._writer.writerows(cleaned_records)
+
+    def close(self):
+        """Flush buffered rows, finish the gzip stream and complete the output"""
+        if self._fh is None:
+            return
+
+        # Detach rather than close: closing the buffer would also close an
+        # uncompressed destination before it could be completed
+        stream = self._fh.detach().detach()
+        self._fh = None
+
+        # GzipFile writes its trailer on close but leaves the file object open
+        if stream is not self._raw:
+            stream.close()
+
+        # Streaming sinks (S3MultipartWriter) only publish on complete()
+        if hasattr(self._raw, 'complete'):
+            self._raw.complete()
+        else:
+            self._raw.close()
 
     def get_cleaner(self):
         """
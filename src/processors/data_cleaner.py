@@ -13,6 +13,24 @@ from src.utils.normalizers import (
 from src.utils.validators import validate_required_fields, validate_age_range
 
 
+# Output columns emitted by DataCleaner.clean_record, in file order
+FIELDNAMES = (
+    'customer_id',
+    'uuid',
+    'name',
+    'email',
+    'age',
+    'phone',
+    'address',
+    'city',
+    'state',
+    'zip_code'
+)
+
+# Fields a record must have (non-empty) to be accepted
+REQUIRED_FIELDS = ('id', 'name')
+
+
 class DataCleaner:
     """
     Data cleaner for ETL pipeline
@@ -24,7 +42,14 @@ class DataCleaner:
         - Track cleaning statistics
     """
 
-    def __init__(self):
+    def __init__(self, preserve_extras=False):
+        """
+        Initialize data cleaner
+
+        Args:
+            preserve_extras: If True, pass through fields outside FIELDNAMES
+        """
+        self.preserve_extras = preserve_extras
         self.records_processed = 0
         self.records_accepted = 0
         self.records_rejected = 0
@@ -43,7 +68,7 @@ class DataCleaner:
         self.records_processed += 1
 
         # Validate required fields
-        is_valid, error = validate_required_fields(record, ['id', 'name'])
+        is_valid, error = validate_required_fields(record, REQUIRED_FIELDS)
         if not is_valid:
             self._add_rejection(error)
             return None
@@ -83,9 +108,10 @@ class DataCleaner:
             cleaned['zip_code'] = normalize_zip_code(record.get('zip_code'))
 
             # Handle any additional fields (generic cleaning)
-            for key, value in record.items():
-                if key not in cleaned:
-                    cleaned[key] = normalize_string(value)
+            if self.preserve_extras:
+                for key, value in record.items():
+                    if key not in cleaned:
+                        cleaned[key] = normalize_string(value)
 
             self.records_accepted += 1
             return cleaned
@@ -94,6 +120,19 @@ class DataCleaner:
             self._add_rejection(f"Cleaning error: {str(e)}")
             return None
 
+    def clean_batch(self, records):
+        """
+        Clean a page of records
+
+        Args:
+            records: List of raw record dictionaries
+
+        Returns:
+            list: Cleaned records (invalid records are dropped)
+        """
+        clean_record = self.clean_record
+        return [cleaned for cleaned in map(clean_record, records) if cleaned]
+
     def _add_rejection(self, reason):
         """
         Record rejection reason
@@ -0,0 +1,111 @@
+"""
+Streaming Parquet writer with integrated data cleaning
+"""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.processors.data_cleaner import FIELDNAMES
+
+
+# Fixed output schema for cleaned customer records
+SCHEMA = pa.schema([
+    (name, pa.int16() if name == 'age' else pa.string())
+    for name in FIELDNAMES
+])
+
+
+class StreamingParquetWriter:
+    """
+    Streaming Parquet writer with ETL integration
+
+    Features:
+        - Columnar output with Snappy compression and dictionary encoding
+        - Buffers cleaned records and writes one row group per flush
+        - Automatic data cleaning before write
+    """
+
+    def __init__(self, filename, cleaner=None, row_group_size=50000,
+                 fileobj=None):
+        """
+        Initialize Parquet writer
+
+        Args:
+            filename: Output filename
+            cleaner: DataCleaner instance (optional, creates one if not provided)
+            row_group_size: Number of buffered records per row group
+            fileobj: Binary stream to write to instead of a local file
+                (optional); completed on close() if it has a complete() method
+        """
+        self.filename = filename
+        self.row_group_size = row_group_size
+        self.buffer = []
+        self.fileobj = fileobj
+
+        self.writer = pq.ParquetWriter(
+            filename if fileobj is None else fileobj,
+            SCHEMA,
+            compression='snappy',
+            use_dictionary=True
+        )
+
+        # Use provided cleaner or create new one
+        if cleaner is None:
+            from src.processors.data_cleaner import DataCleaner
+            self.cleaner = DataCleaner()
+        else:
+            self.cleaner = cleaner
+
+    def write_records(self, records):
+        """
+        Clean and buffer records, flushing full row groups to disk
+
+        Args:
+            records: List of raw record dictionaries
+        """
+        if not records:
+            return
+
+        # ETL: Clean data first (invalid records are dropped)
+        self.buffer.extend(self.cleaner.clean_batch(records))
+
+        if len(self.buffer) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        """Write buffered records as a single row group"""
+        if not self.buffer:
+            return
+
+        table = pa.Table.from_pylist(self.buffer, schema=SCHEMA)
+        self.writer.write_table(table)
+        self.buffer = []
+
+    def close(self):
+        """Flush remaining records and finalize the Parquet footer"""
+        self._flush()
+        self.writer.close()
+
+        # Streaming sinks (S3MultipartWriter) only publish on complete()
+        if hasattr(self.fileobj, 'complete'):
+            self.fileobj.complete()
+        elif self.fileobj is not None:
+            self.fileobj.close()
+
+    def get_cleaner(self):
+        """
+        Get the data cleaner instance
+
+        Returns:
+            DataCleaner: The cleaner instance
+        """
+        return self.cleaner
+
+    def get_records_written(self):
+        """
+        Get count of records written
+
+        Returns:
+            int: Number of records written
+        """
+        return self.cleaner.records_accepted
@@ -2,6 +2,12 @@
 Storage modules for data persistence
 """
 
-from .s3_uploader import upload_to_s3
+from .s3_uploader import upload_to_s3, build_s3_key, get_s3_client
+from .s3_stream import S3MultipartWriter
 
-__all__ = ['upload_to_s3']
+__all__ = [
+    'upload_to_s3',
+    'build_s3_key',
+    'get_s3_client',
+    'S3MultipartWriter'
+]
@@ -0,0 +1,176 @@
+"""
+Streaming S3 upload via multipart upload
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from src.storage.s3_uploader import get_s3_client
+
+
+# S3 requires every part except the last to be at least 5MB
+PART_SIZE = 16 * 1024 * 1024
+
+
+class S3MultipartWriter(io.RawIOBase):
+    """
+    Writable binary stream that uploads to S3 as data arrives
+
+    Features:
+        - Uploads fixed-size parts in background threads while writing continues
+        - Bounded number of in-flight parts (bounded memory)
+        - Small outputs fall back to a single put_object on complete()
+        - Closing without complete() aborts, so partial data is never published
+    """
+
+    def __init__(self, bucket, key, part_size=PART_SIZE, max_in_flight=4):
+        """
+        Initialize streaming writer
+
+        Args:
+            bucket: S3 bucket name
+            key: S3 object key
+            part_size: Bytes per multipart part
+            max_in_flight: Maximum parts uploading concurrently
+        """
+        super().__init__()
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.max_in_flight = max_in_flight
+
+        self.s3_client = get_s3_client()
+        self.upload_id = None
+        self.aborted = False
+        self.completed = False
+
+        self._buffer = bytearray()
+        self._parts = []
+        self._executor = None
+
+    @property
+    def uri(self):
+        """S3 URI of the object being written"""
+        return f"s3://{self.bucket}/{self.key}"
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        """
+        Buffer data, uploading a part each time part_size bytes accumulate
+
+        Args:
+            data: Bytes-like object
+
+        Returns:
+            int: Number of bytes accepted
+        """
+        if self.closed:
+            raise ValueError("write to closed S3MultipartWriter")
+        if self.aborted:
+            return len(data)
+
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+
+        return len(data)
+
+    def _upload_part(self, body):
+        """Submit one part for background upload"""
+        if self.upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key
+            )
+            self.upload_id = response['UploadId']
+            self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+
+        # Wait for the oldest pending part before queueing another
+        in_flight = [f for _, f in self._parts if not f.done()]
+        if len(in_flight) >= self.max_in_flight:
+            in_flight[0].result()
+
+        part_number = len(self._parts) + 1
+        future = self._executor.submit(
+            self.s3_client.upload_part,
+            Bucket=self.bucket,
+            Key=self.key,
+            PartNumber=part_number,
+            UploadId=self.upload_id,
+            Body=body
+        )
+        self._parts.append((part_number, future))
+
+    def complete(self):
+        """
+        Upload remaining data and complete the upload, then close
+
+        Call only after all data was written successfully. Closing a
+        writer that was never completed (including on garbage
+        collection) aborts the upload instead.
+        """
+        if self.closed:
+            raise ValueError("complete on closed S3MultipartWriter")
+
+        try:
+            if self.aborted:
+                return
+
+            if self.upload_id is None:
+                # Small output: a single PUT is enough
+                self.s3_client.put_object(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    Body=bytes(self._buffer)
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+
+                parts = [
+                    {'PartNumber': n, 'ETag': f.result()['ETag']}
+                    for n, f in self._parts
+                ]
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=self.upload_id,
+                    MultipartUpload={'Parts': parts}
+                )
+            self.completed = True
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the stream, aborting the upload unless complete() succeeded"""
+        if self.closed:
+            return
+
+        try:
+            if not self.completed:
+                self.abort()
+        finally:
+            self._buffer = bytearray()
+            if self._executor:
+                self._executor.shutdown(wait=True)
+            super().close()
+
+    def abort(self):
+        """Discard buffered data and abort any started multipart upload"""
+        if self.aborted:
+            return
+
+        self.aborted = True
+        self._buffer = bytearray()
+
+        if self.upload_id is not None:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id
+            )
@@ -3,9 +3,61 @@ S3 upload functionality
 """
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from datetime import datetime
 
 
+# Multipart settings: 32MB parts uploaded by 16 threads
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=32 * 1024 * 1024,
+    multipart_chunksize=32 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True
+)
+
+# Connection pool sized so transfer threads don't wait on connections
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Shared client, created on first use
+_s3_client = None
+
+
+def get_s3_client():
+    """
+    Get the shared S3 client
+
+    Credentials, endpoint resolution and the connection pool are set up
+    once per process instead of once per upload.
+
+    Returns:
+        botocore client for S3
+    """
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client('s3', config=CLIENT_CONFIG)
+    return _s3_client
+
+
+def build_s3_key(prefix, filename):
+    """
+    Build a date-partitioned S3 key
+
+    Args:
+        prefix: S3 key prefix
+        filename: Object file name
+
+    Returns:
+        str: Key in the form prefix/date=YYYY-MM-DD/filename
+    """
+    date_str = datetime.now().strftime('%Y-%m-%d')
+    return f"{prefix}/date={date_str}/{filename}"
+
+
 def upload_to_s3(local_filename, bucket, prefix):
     """
     Upload file to S3 with date-based partitioning
@@ -21,17 +73,17 @@ def upload_to_s3(local_filename, bucket, prefix):
     print("\n Uploading to S3...")
 
     try:
-        s3_client = boto3.client('s3')
+        s3_client = get_s3_client()
 
         # S3 key: prefix/date=YYYY-MM-DD/filename
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        s3_key = f"{prefix}/date={date_str}/{local_filename}"
+        s3_key = build_s3_key(prefix, local_filename)
 
         # Upload
         s3_client.upload_file(
             local_filename,
             bucket,
-            s3_key
+            s3_key,
+            Config=TRANSFER_CONFIG
         )
 
         s3_uri = f"s3://{bucket}/{s3_key}"
@@ -62,11 +114,10 @@ def upload_to_s3_with_metadata(local_filename, bucket, prefix, metadata=None):
     print("\n Uploading to S3 with metadata...")
 
     try:
-        s3_client = boto3.client('s3')
+        s3_client = get_s3_client()
 
         # S3 key: prefix/date=YYYY-MM-DD/filename
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        s3_key = f"{prefix}/date={date_str}/{local_filename}"
+        s3_key = build_s3_key(prefix, local_filename)
 
         # Prepare extra args
         extra_args = {}
@@ -80,7 +131,8 @@ def upload_to_s3_with_metadata(local_filename, bucket, prefix, metadata=None):
             local_filename,
             bucket,
             s3_key,
-            ExtraArgs=extra_args if extra_args else None
+            ExtraArgs=extra_args if extra_args else None,
+            Config=TRANSFER_CONFIG
         )
 
         s3_uri = f"s3://{bucket}/{s3_key}"
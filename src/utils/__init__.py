@@ -5,6 +5,7 @@ Utility modules for data ingestion
 from .normalizers import (
     normalize_string,
     normalize_email,
+    normalize_and_validate_email,
     normalize_phone,
     normalize_name,
     normalize_state,
@@ -22,9 +23,14 @@ from .retry import calculate_backoff
 
 from .logger import IngestionLogger
 
+from .rate_limiter import TokenBucket
+
+from .token_cache import get_token, get_token_entry, TokenStore, FileTokenStore
+
 __all__ = [
     'normalize_string',
     'normalize_email',
+    'normalize_and_validate_email',
     'normalize_phone',
     'normalize_name',
     'normalize_state',
@@ -34,5 +40,10 @@ __all__ = [
     'validate_email_format',
     'validate_age_range',
     'calculate_backoff',
-    'IngestionLogger'
+    'IngestionLogger',
+    'TokenBucket',
+    'get_token',
+    'get_token_entry',
+    'TokenStore',
+    'FileTokenStore'
 ]
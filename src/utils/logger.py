@@ -2,37 +2,68 @@
 Logging utilities for ingestion pipeline
 """
 
+import sys
+import threading
+
 
 class IngestionLogger:
     """
     Simple logger for ingestion processes
 
-    Provides consistent formatting for console output
+    Provides consistent formatting for console output. Lines are
+    buffered and written to stdout in batches of buffer_size; warnings
+    and errors are written immediately, together with any lines buffered
+    before them. Safe to share between threads.
     """
 
-    def __init__(self, prefix=""):
+    def __init__(self, prefix="", buffer_size=1):
+        """
+        Initialize logger
+
+        Args:
+            prefix: String prepended to every message
+            buffer_size: Number of lines to collect before writing
+        """
         self.prefix = prefix
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._lock = threading.RLock()
+
+    def _emit(self, line, flush=False):
+        """Buffer a line, writing the batch once it is full (or on flush)"""
+        with self._lock:
+            self._buffer.append(line + "\n")
+            if flush or len(self._buffer) >= self.buffer_size:
+                self.flush()
+
+    def flush(self):
+        """Write all buffered lines to stdout"""
+        with self._lock:
+            if self._buffer:
+                sys.stdout.write(''.join(self._buffer))
+                sys.stdout.flush()
+                self._buffer = []
 
     def info(self, message):
         """Log informational message"""
-        print(f"{self.prefix}{message}")
+        self._emit(f"{self.prefix}{message}")
 
     def success(self, message):
         """Log success message"""
-        print(f"{self.prefix}✅ {message}")
+        self._emit(f"{self.prefix}✅ {message}")
 
     def warning(self, message):
         """Log warning message"""
-        print(f"{self.prefix}⚠️ {message}")
+        self._emit(f"{self.prefix}⚠️ {message}", flush=True)
 
     def error(self, message):
         """Log error message"""
-        print(f"{self.prefix}❌ {message}")
+        self._emit(f"{self.prefix}❌ {message}", flush=True)
 
     def progress(self, current, total, message=""):
         """Log progress update"""
-        print(f"{self.prefix}[{current}/{total}] {message}")
+        self._emit(f"{self.prefix}[{current}/{total}] {message}")
 
     def separator(self, char="-", length=50):
         """Print separator line"""
-        print(char * length)
+        self._emit(char * length)
@@ -3,6 +3,11 @@ String normalization utilities for data cleaning
 """
 
 
+# bytes.translate delete tables: everything except ASCII '0'-'9' (and '-')
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 48 <= b <= 57)
+_NON_ZIP_BYTES = _NON_DIGIT_BYTES.replace(b'-', b'')
+
+
 def normalize_string(value, default='N/A'):
     """
     Basic string normalization: convert to string and strip whitespace
@@ -32,16 +37,34 @@ def normalize_email(email, default='no-email@example.com'):
     Returns:
         str: Normalized email
     """
+    return normalize_and_validate_email(email, default)[0]
+
+
+def normalize_and_validate_email(email, default='no-email@example.com'):
+    """
+    Normalize an email and report whether it passed format validation
+
+    Does the strip/lowercase and format check in one pass, for callers
+    that need both the cleaned value and its validity.
+
+    Args:
+        email: Email string
+        default: Default value for invalid emails
+
+    Returns:
+        tuple: (normalized_email, is_valid); normalized_email is default
+            when is_valid is False
+    """
     if not email:
-        return default
+        return default, False
 
     cleaned = str(email).strip().lower()
 
     # Basic format validation
     if '@' in cleaned and '.' in cleaned:
-        return cleaned
+        return cleaned, True
 
-    return default
+    return default, False
 
 
 def normalize_phone(phone, default='N/A'):
@@ -58,7 +81,7 @@ def normalize_phone(phone, default='N/A'):
     if not phone:
         return default
 
-    digits = extract_digits(str(phone))
+    digits = extract_digits(phone)
     return digits if digits else default
 
 
@@ -112,13 +135,18 @@ def normalize_zip_code(zip_code, default='N/A'):
     if not zip_code:
         return default
 
-    cleaned = ''.join(c for c in str(zip_code).strip() if c.isdigit() or c == '-')
+    cleaned = str(zip_code).strip()
+    if not (cleaned.isascii() and cleaned.isdigit()):
+        # Non-ASCII characters (including non-ASCII digits) are dropped
+        cleaned = cleaned.encode('ascii', 'ignore').translate(
+            None, _NON_ZIP_BYTES
+        ).decode('ascii')
     return cleaned if cleaned else default
 
 
 def extract_digits(value):
     """
-    Extract only digits from a string
+    Extract only ASCII digits (0-9) from a string
 
     Args:
         value: Input string
@@ -129,4 +157,12 @@ def extract_digits(value):
     if not value:
         return ''
 
-    return ''.join(c for c in str(value) if c.isdigit())
+    value = str(value)
+
+    # Already clean, or strip everything but '0'-'9' with bytes.translate
+    if value.isascii() and value.isdigit():
+        return value
+
+    return value.encode('ascii', 'ignore').translate(
+        None, _NON_DIGIT_BYTES
+    ).decode('ascii')
@@ -2,15 +2,30 @@
 Retry and backoff utilities
 """
 
+import array
+import itertools
 import random
 
 
+# Jitter multipliers (±25%) drawn once at import and cycled through
+_JITTER_SIZE = 1024
+_JITTER = array.array(
+    'd',
+    [0.25 * (random.random() * 2 - 1) for _ in range(_JITTER_SIZE)]
+)
+_jitter_index = itertools.count()
+
+# Powers of two for the exponential term; attempts beyond the table are capped
+_POW2 = tuple(1 << i for i in range(32))
+_MAX_ATTEMPT = len(_POW2) - 1
+
+
 def calculate_backoff(attempt, initial_backoff=1, is_rate_limit=False):
     """
     Calculate exponential backoff time with jitter
 
     Args:
-        attempt: Current attempt number (0-based)
+        attempt: Current attempt number (0-based, capped at 31)
         initial_backoff: Base backoff time in seconds
         is_rate_limit: If True, use longer wait time for rate limits
 
@@ -18,13 +33,15 @@ def calculate_backoff(attempt, initial_backoff=1, is_rate_limit=False):
         float: Wait time in seconds
     """
     # Exponential backoff: 2^attempt
-    base_wait = initial_backoff * (2 ** attempt)
+    if attempt > _MAX_ATTEMPT:
+        attempt = _MAX_ATTEMPT
+    base_wait = initial_backoff * _POW2[attempt]
 
     # Rate limits get longer wait time
     if is_rate_limit:
         base_wait *= 2
 
     # Add jitter (±25% random variation)
-    jitter = base_wait * 0.25 * (random.random() * 2 - 1)
+    jitter = base_wait * _JITTER[next(_jitter_index) % _JITTER_SIZE]
 
     return base_wait + jitter
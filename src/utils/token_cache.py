@@ -0,0 +1,179 @@
+"""
+Bearer token caching for the CRM API login endpoint
+"""
+
+import json
+from abc import ABC, abstractmethod
+import os
+import threading
+import time
+
+import requests
+
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'ingest_token.json'
+)
+
+# Refresh tokens this many seconds before they expire
+EXPIRY_SLACK = 60
+
+# In-process cache: (login_url, username) -> token entry
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+class TokenStore(ABC):
+    """
+    Persistent storage backend for cached tokens
+
+    Subclass and override load/save to share tokens through another
+    backend (e.g. Redis or DynamoDB) instead of the local file.
+    """
+
+    @abstractmethod
+    def load(self):
+        """
+        Load the cached token entry
+
+        Returns:
+            dict: Token entry, or None if nothing is cached
+        """
+
+    @abstractmethod
+    def save(self, entry):
+        """
+        Persist a token entry
+
+        Args:
+            entry: Dict with login_url, username, token and expires_at
+        """
+
+
+class FileTokenStore(TokenStore):
+    """Token store backed by a JSON file readable only by the owner"""
+
+    def __init__(self, path=None):
+        """
+        Initialize file store
+
+        Args:
+            path: Cache file path (defaults to $TOKEN_CACHE_PATH, then
+                DEFAULT_CACHE_PATH; set it where HOME is read-only,
+                e.g. /tmp/ingest_token.json on Lambda)
+        """
+        self.path = path or os.getenv('TOKEN_CACHE_PATH') or DEFAULT_CACHE_PATH
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, entry):
+        # A bare file name (e.g. TOKEN_CACHE_PATH=token.json) has no directory
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write to a temp file and swap it in so readers never see half a file
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self.path)
+
+
+def get_token(login_url, username, password, store=None, timeout=30):
+    """
+    Get a bearer token, logging in only when no fresh cached token exists
+
+    Args:
+        login_url: Login endpoint URL
+        username: Login username
+        password: Login password
+        store: TokenStore instance (defaults to FileTokenStore)
+        timeout: Login request timeout in seconds
+
+    Returns:
+        str: Bearer token
+
+    Raises:
+        requests.HTTPError: If the login request fails
+    """
+    return get_token_entry(login_url, username, password, store, timeout)['token']
+
+
+def get_token_entry(login_url, username, password, store=None, timeout=30):
+    """
+    Get the cached token entry, logging in only when no fresh one exists
+
+    Checks the in-process cache, then the persistent store, and finally
+    POSTs to the login endpoint and saves the new token.
+
+    Args:
+        login_url: Login endpoint URL
+        username: Login username
+        password: Login password
+        store: TokenStore instance (defaults to FileTokenStore)
+        timeout: Login request timeout in seconds
+
+    Returns:
+        dict: Token entry with login_url, username, token and expires_at
+
+    Raises:
+        requests.HTTPError: If the login request fails
+    """
+    key = (login_url, username)
+
+    with _memo_lock:
+        entry = _memo.get(key)
+        if _is_fresh(entry, login_url, username):
+            return entry
+
+        store = store or FileTokenStore()
+        entry = store.load()
+        if not _is_fresh(entry, login_url, username):
+            entry = _login(login_url, username, password, timeout)
+
+            # Caching is best-effort: an unwritable store must not fail the run
+            try:
+                store.save(entry)
+            except OSError as e:
+                print(f" Token cache not saved ({e}), using in-memory token")
+
+        _memo[key] = entry
+        return entry
+
+
+def _is_fresh(entry, login_url, username):
+    """Check a cached entry belongs to this login and is not about to expire"""
+    if not entry:
+        return False
+    if entry.get('login_url') != login_url or entry.get('username') != username:
+        return False
+    return time.time() < entry.get('expires_at', 0) - EXPIRY_SLACK
+
+
+def _login(login_url, username, password, timeout):
+    """
+    Request a new token from the login endpoint
+
+    Returns:
+        dict: Token entry with absolute expiry timestamp
+    """
+    response = requests.post(
+        login_url,
+        json={'username': username, 'password': password},
+        timeout=timeout
+    )
+    response.raise_for_status()
+
+    data = response.json()
+    return {
+        'login_url': login_url,
+        'username': username,
+        'token': data['access_token'],
+        'expires_at': time.time() + data['expires_in']
+    }
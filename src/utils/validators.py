@@ -2,6 +2,8 @@
 Data validation utilities
 """
 
+from src.utils.normalizers import normalize_and_validate_email
+
 
 def validate_required_fields(record, required_fields):
     """
@@ -19,8 +21,15 @@ def validate_required_fields(record, required_fields):
             return False, f"Missing field: {field}"
 
         value = record[field]
-        if value is None or str(value).strip() == '':
-            return False, f"Empty field: {field}"
+        value_type = type(value)
+
+        # Strings are stripped as-is; ints can never be blank
+        if value_type is str:
+            if not value.strip():
+                return False, f"Empty field: {field}"
+        elif value_type is not int:
+            if value is None or str(value).strip() == '':
+                return False, f"Empty field: {field}"
 
     return True, None
 
@@ -35,11 +44,7 @@ def validate_email_format(email):
     Returns:
         bool: True if valid format
     """
-    if not email:
-        return False
-
-    email_str = str(email).strip()
-    return '@' in email_str and '.' in email_str
+    return normalize_and_validate_email(email)[1]
 
 
 def validate_age_range(age, min_age=0, max_age=120):
@@ -54,10 +59,15 @@ def validate_age_range(age, min_age=0, max_age=120):
     Returns:
         tuple: (is_valid, normalized_age)
     """
-    try:
-        age_int = int(age) if age else 0
-        if min_age <= age_int <= max_age:
-            return True, age_int
-        return False, 0
-    except (ValueError, TypeError):
-        return False, 0
+    # JSON ages are usually ints already: skip the int() conversion
+    if type(age) is int:
+        age_int = age
+    else:
+        try:
+            age_int = int(age) if age else 0
+        except (ValueError, TypeError):
+            return False, 0
+
+    if min_age <= age_int <= max_age:
+        return True, age_int
+    return False, 0